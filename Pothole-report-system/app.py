@@ -1,32 +1,56 @@
-from flask import Flask, request, jsonify, render_template, session, redirect, url_for
+from flask import Flask, Response, request, jsonify, render_template, session, redirect, url_for, abort, make_response
 from flask_sqlalchemy import SQLAlchemy
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask_compress import Compress
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
+from sqlalchemy import and_, or_, select
+from sqlalchemy.exc import IntegrityError
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from authlib.integrations.flask_client import OAuth, OAuthError
 from werkzeug.utils import secure_filename
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError
+from cachetools import TTLCache
+import threading
 import uuid
-from datetime import datetime
+import secrets
+from datetime import datetime, timedelta
 import os
 from functools import wraps
 import json
+import orjson
 from dotenv import load_dotenv
 
 # ✅ Load environment variables before using them
 load_dotenv()
 
-import pymysql
-pymysql.install_as_MySQLdb()
-
-# Debug print (optional)
-print("DB URI:", f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}")
-
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY')
+app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(hours=2)
+# Staff sessions are permanent and expire two hours after login without sliding;
+# citizen sessions stay browser-session cookies
+app.config['SESSION_REFRESH_EACH_REQUEST'] = False
 app.config['SQLALCHEMY_DATABASE_URI'] = (
-    f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}"
+    f"mysql+mysqldb://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}"
     f"@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
 )
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 25,
+    'max_overflow': 25,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+    'pool_timeout': 10,
+    'query_cache_size': 1200
+}
 
 
 # AWS S3 Configuration
@@ -34,16 +58,71 @@ AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
 AWS_BUCKET_NAME = os.getenv('AWS_BUCKET_NAME')
 AWS_REGION = os.getenv('AWS_REGION')
+CLOUDFRONT_DOMAIN = os.getenv('CLOUDFRONT_DOMAIN')
+
+# Google sign-in (OpenID Connect); enabled when a client ID is configured
+GOOGLE_CLIENT_ID = os.getenv('GOOGLE_CLIENT_ID')
+GOOGLE_CLIENT_SECRET = os.getenv('GOOGLE_CLIENT_SECRET')
 
 # Initialize extensions
 db = SQLAlchemy(app)
+Compress(app)
+# Per-process in-memory counters, like the other caches here
+limiter = Limiter(get_remote_address, app=app, storage_uri='memory://')
 s3_client = boto3.client(
     's3',
     aws_access_key_id=AWS_ACCESS_KEY_ID,
     aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-    region_name=AWS_REGION
+    region_name=AWS_REGION,
+    config=Config(
+        max_pool_connections=50,
+        retries={'max_attempts': 5, 'mode': 'adaptive'},
+        tcp_keepalive=True,
+        signature_version='s3v4'
+    )
+)
+
+# Upload phone photos in parallel 8 MiB parts once they exceed 5 MiB
+s3_transfer_config = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
 )
 
+oauth = OAuth(app)
+if GOOGLE_CLIENT_ID:
+    oauth.register(
+        name='google',
+        client_id=GOOGLE_CLIENT_ID,
+        client_secret=GOOGLE_CLIENT_SECRET,
+        server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
+        client_kwargs={'scope': 'openid email profile'}
+    )
+
+# Stored as password_hash for accounts created through Google sign-in;
+# it never matches, so those accounts cannot use password login
+UNUSABLE_PASSWORD = '!'
+
+# Argon2id sized for interactive logins (~tens of ms, 64 MiB); older PBKDF2
+# hashes are still accepted and upgraded on the user's next login
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1)
+
+# Report listings are paged by (created_at, id) keyset cursors
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Presigned image URLs are valid for an hour; reuse them for a bit less
+PRESIGNED_URL_EXPIRES = 3600
+presigned_url_cache = TTLCache(maxsize=10000, ttl=PRESIGNED_URL_EXPIRES - 300)
+presigned_url_cache_lock = threading.Lock()
+
+# Public report pages are identical for every visitor; serve them from memory
+# for up to a minute and drop them whenever a report's status changes
+PUBLIC_REPORTS_CACHE_TTL = 60
+public_reports_cache = TTLCache(maxsize=256, ttl=PUBLIC_REPORTS_CACHE_TTL)
+public_reports_cache_lock = threading.Lock()
+
 # Database Models
 class CustomUser(db.Model):
     __tablename__ = 'custom_user'
@@ -54,6 +133,7 @@ class CustomUser(db.Model):
     email = db.Column(db.String(120), unique=True, nullable=False)
     phone_number = db.Column(db.String(15))
     password_hash = db.Column(db.String(255), nullable=False)
+    oauth_sub = db.Column(db.String(255), unique=True)  # OpenID Connect subject for Google sign-in
     credits = db.Column(db.Integer, default=0)
     is_staff = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -82,6 +162,11 @@ class PotholeReport(db.Model):
     # Relationship
     verification = db.relationship('MunicipalVerification', backref='report', uselist=False)
 
+    __table_args__ = (
+        db.Index('idx_status_created_at', 'status', 'created_at'),
+        db.Index('idx_user_created_at', 'user_id', 'created_at'),
+    )
+
 class MunicipalVerification(db.Model):
     __tablename__ = 'municipal_verification'
     
@@ -105,13 +190,103 @@ def upload_to_s3(file, filename):
             ExtraArgs={
                 'ContentType': 'image/jpeg',
                 'ACL': 'public-read'
-            }
+            },
+            Config=s3_transfer_config
         )
         s3_url = f"https://{AWS_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com/{s3_key}"
         return s3_url, s3_key
     except NoCredentialsError:
         return None, None
 
+def hash_password(password):
+    return password_hasher.hash(password)
+
+def verify_password(user, password):
+    """Check a login password, rehashing legacy or outdated hashes with the current Argon2 settings"""
+    if user.password_hash == UNUSABLE_PASSWORD:
+        return False
+    if user.password_hash.startswith('$argon2'):
+        try:
+            password_hasher.verify(user.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        needs_rehash = password_hasher.check_needs_rehash(user.password_hash)
+    else:
+        if not check_password_hash(user.password_hash, password):
+            return False
+        needs_rehash = True
+
+    if needs_rehash:
+        user.password_hash = hash_password(password)
+        db.session.commit()
+    return True
+
+def award_credits(user_id, amount):
+    """Add credits to a user in a single UPDATE; committed with the caller's transaction"""
+    CustomUser.query.filter_by(user_id=user_id).update(
+        {CustomUser.credits: CustomUser.credits + amount},
+        synchronize_session=False
+    )
+
+def paginate_reports(stmt):
+    """Run a report SELECT for one page (newest first); returns row dicts and the next page cursor"""
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            created_at, report_pk = cursor.rsplit('_', 1)
+            created_at = datetime.fromisoformat(created_at)
+            report_pk = int(report_pk)
+            if created_at.tzinfo is not None:
+                raise ValueError('cursor datetime must be naive')
+        except ValueError:
+            abort(make_response(jsonify({'error': 'Invalid cursor'}), 400))
+        stmt = stmt.where(or_(
+            PotholeReport.created_at < created_at,
+            and_(PotholeReport.created_at == created_at, PotholeReport.id < report_pk)
+        ))
+
+    stmt = stmt.order_by(PotholeReport.created_at.desc(), PotholeReport.id.desc()).limit(limit + 1)
+    rows = db.session.execute(stmt).mappings().all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = f"{rows[-1]['created_at'].isoformat()}_{rows[-1]['id']}"
+
+    reports = []
+    for row in rows:
+        report = dict(row)
+        del report['id']  # internal key, only needed for the cursor
+        reports.append(report)
+    return reports, next_cursor
+
+def dump_json(data):
+    """Encode rows as JSON bytes; naive datetimes are emitted as UTC ISO 8601"""
+    return orjson.dumps(data, option=orjson.OPT_NAIVE_UTC)
+
+def paginated_response(body, next_cursor):
+    """JSON response for an encoded page with the next page cursor in the X-Next-Cursor header"""
+    response = Response(body, mimetype='application/json')
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
+
+def session_user_is_staff():
+    """Re-read is_staff from the database for writes that must honour a revoked staff flag"""
+    return bool(db.session.query(CustomUser.is_staff).filter_by(user_id=session['user_id']).scalar())
+
+def clear_public_reports_cache():
+    with public_reports_cache_lock:
+        public_reports_cache.clear()
+
+def login_username():
+    """Rate-limit key for password login attempts against one username"""
+    data = request.get_json(silent=True) or {}
+    return f"login:{data.get('username', '')}"
+
 def login_required(f):
     """Decorator for routes that require login"""
     @wraps(f)
@@ -128,12 +303,21 @@ def staff_required(f):
         if 'user_id' not in session:
             return redirect(url_for('login'))
         
-        user = CustomUser.query.filter_by(user_id=session['user_id']).first()
-        if not user or not user.is_staff:
+        # is_staff is set from the database at login and the session cookie is signed
+        if not session.get('is_staff'):
             return jsonify({'error': 'Staff access required'}), 403
         return f(*args, **kwargs)
     return decorated_function
 
+@app.errorhandler(429)
+def too_many_requests(e):
+    return jsonify({'error': 'Too many login attempts, please try again later'}), 429
+
+@app.errorhandler(413)
+def file_too_large(e):
+    max_mb = app.config['MAX_CONTENT_LENGTH'] // (1024 * 1024)
+    return jsonify({'error': f'Image is too large (max {max_mb} MB)'}), 413
+
 # Routes
 @app.route('/')
 def index():
@@ -145,10 +329,10 @@ def register():
         data = request.get_json()
         
         # Check if user already exists
-        if CustomUser.query.filter_by(username=data['username']).first():
+        if db.session.query(CustomUser.id).filter_by(username=data['username']).first():
             return jsonify({'error': 'Username already exists'}), 400
         
-        if CustomUser.query.filter_by(email=data['email']).first():
+        if db.session.query(CustomUser.id).filter_by(email=data['email']).first():
             return jsonify({'error': 'Email already exists'}), 400
         
         # Create new user
@@ -156,7 +340,7 @@ def register():
             username=data['username'],
             email=data['email'],
             phone_number=data.get('phone_number'),
-            password_hash=generate_password_hash(data['password'])
+            password_hash=hash_password(data['password'])
         )
         
         db.session.add(user)
@@ -167,20 +351,103 @@ def register():
     return render_template('register.html')
 
 @app.route('/login', methods=['GET', 'POST'])
+@limiter.limit('10 per minute', methods=['POST'])
+@limiter.limit('5 per minute', key_func=login_username, methods=['POST'])
 def login():
     if request.method == 'POST':
         data = request.get_json()
         user = CustomUser.query.filter_by(username=data['username']).first()
         
-        if user and check_password_hash(user.password_hash, data['password']):
+        if user and verify_password(user, data['password']):
             session['user_id'] = user.user_id
             session['username'] = user.username
             session['is_staff'] = user.is_staff
+            session.permanent = user.is_staff
             return jsonify({'message': 'Login successful', 'is_staff': user.is_staff}), 200
         
         return jsonify({'error': 'Invalid credentials'}), 401
     
-    return render_template('login.html')
+    return render_template('login.html', google_login_enabled=bool(GOOGLE_CLIENT_ID))
+
+def create_oauth_user(userinfo):
+    """Create a citizen account for a Google identity, retrying if the username is taken"""
+    base_username = userinfo['email'].split('@')[0][:60]
+    username = base_username
+    for _ in range(5):
+        user = CustomUser(
+            username=username,
+            email=userinfo['email'],
+            password_hash=UNUSABLE_PASSWORD,
+            oauth_sub=userinfo['sub']
+        )
+        db.session.add(user)
+        try:
+            db.session.commit()
+            return user
+        except IntegrityError:
+            db.session.rollback()
+            # A concurrent callback may have created this identity or email already
+            existing = CustomUser.query.filter_by(oauth_sub=userinfo['sub']).first()
+            if existing:
+                return existing
+            if db.session.query(CustomUser.id).filter_by(email=userinfo['email']).first():
+                return None
+            username = f"{base_username}_{secrets.token_hex(3)}"
+    return None
+
+@app.route('/login/google')
+def google_login():
+    google = oauth.create_client('google')
+    if not google:
+        return redirect(url_for('login'))
+    return google.authorize_redirect(url_for('google_callback', _external=True))
+
+@app.route('/login/google/callback')
+def google_callback():
+    google = oauth.create_client('google')
+    if not google:
+        return redirect(url_for('login'))
+
+    try:
+        # Verifies the id_token against Google's JWKS, which Authlib caches
+        token = google.authorize_access_token()
+    except OAuthError:
+        return redirect(url_for('login'))
+
+    userinfo = token.get('userinfo')
+    if not userinfo or not userinfo.get('email_verified'):
+        return redirect(url_for('login'))
+
+    user = CustomUser.query.filter_by(oauth_sub=userinfo['sub']).first()
+
+    if 'user_id' in session:
+        # Linking Google to the account that is already logged in
+        current = CustomUser.query.filter_by(user_id=session['user_id']).first()
+        if not current or current.is_staff or (user and user.user_id != current.user_id):
+            return redirect(url_for('dashboard'))
+        if not user:
+            current.oauth_sub = userinfo['sub']
+            db.session.commit()
+        return redirect(url_for('dashboard'))
+
+    if not user:
+        # Never link by email: the app does not verify emails at registration,
+        # so an existing account with this address may not belong to this person
+        if db.session.query(CustomUser.id).filter_by(email=userinfo['email']).first():
+            return redirect(url_for('login'))
+        user = create_oauth_user(userinfo)
+        if not user:
+            return redirect(url_for('login'))
+
+    # Staff must sign in through /municipal-login
+    if user.is_staff:
+        return redirect(url_for('municipal_login'))
+
+    session['user_id'] = user.user_id
+    session['username'] = user.username
+    session['is_staff'] = user.is_staff
+    session.permanent = user.is_staff
+    return redirect(url_for('dashboard'))
 
 @app.route('/logout')
 def logout():
@@ -190,11 +457,10 @@ def logout():
 @app.route('/dashboard')
 @login_required
 def dashboard():
-    user = CustomUser.query.filter_by(user_id=session['user_id']).first()
-    if user.is_staff:
+    if session.get('is_staff'):
         return render_template('municipal_dashboard.html')
     else:
-        return render_template('user_dashboard.html')
+        return render_template('user_dashboard.html', google_login_enabled=bool(GOOGLE_CLIENT_ID))
 
 @app.route('/report-pothole', methods=['GET', 'POST'])
 @login_required
@@ -208,16 +474,21 @@ def report_pothole():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
         
-        # Generate unique filename
-        filename = f"{uuid.uuid4()}_{secure_filename(file.filename)}"
+        # Generate unique filename, spread across hashed prefixes so S3
+        # can partition writes instead of funnelling them into one prefix
+        uid = uuid.uuid4()
+        filename = f"{uid.hex[:2]}/{uid.hex[2:4]}/{uid.hex}_{secure_filename(file.filename)}"
         
         # Upload to S3
         s3_url, s3_key = upload_to_s3(file, filename)
         if not s3_url:
             return jsonify({'error': 'Failed to upload image'}), 500
         
-        # Create local image URL
-        local_image_url = url_for('serve_image', s3_key=s3_key, _external=True)
+        # Point at the CDN when one fronts the bucket, otherwise go through serve_image
+        if CLOUDFRONT_DOMAIN:
+            local_image_url = f"https://{CLOUDFRONT_DOMAIN}/{s3_key}"
+        else:
+            local_image_url = url_for('serve_image', s3_key=s3_key, _external=True)
         
         # Create report
         report = PotholeReport(
@@ -234,8 +505,7 @@ def report_pothole():
         db.session.add(report)
         
         # Award credits to user
-        user = CustomUser.query.filter_by(user_id=session['user_id']).first()
-        user.credits += 5
+        award_credits(session['user_id'], 5)
         
         db.session.commit()
         
@@ -246,22 +516,20 @@ def report_pothole():
 @app.route('/api/my-reports')
 @login_required
 def my_reports():
-    reports = PotholeReport.query.filter_by(user_id=session['user_id']).order_by(PotholeReport.created_at.desc()).all()
-    
-    reports_data = []
-    for report in reports:
-        reports_data.append({
-            'report_id': report.report_id,
-            'description': report.description,
-            'location_name': report.location_name,
-            'severity': report.severity,
-            'status': report.status,
-            'credits_awarded': report.credits_awarded,
-            'created_at': report.created_at.strftime('%Y-%m-%d %H:%M'),
-            'image_url': report.image_url
-        })
-    
-    return jsonify(reports_data)
+    stmt = select(
+        PotholeReport.id,
+        PotholeReport.report_id,
+        PotholeReport.description,
+        PotholeReport.location_name,
+        PotholeReport.severity,
+        PotholeReport.status,
+        PotholeReport.credits_awarded,
+        PotholeReport.created_at,
+        PotholeReport.image_url
+    ).where(PotholeReport.user_id == session['user_id'])
+
+    reports, next_cursor = paginate_reports(stmt)
+    return paginated_response(dump_json(reports), next_cursor)
 
 @app.route('/api/user-profile')
 @login_required
@@ -279,28 +547,29 @@ def user_profile():
 @app.route('/api/pending-reports')
 @staff_required
 def pending_reports():
-    reports = PotholeReport.query.filter_by(status='PENDING').order_by(PotholeReport.created_at.desc()).all()
-    
-    reports_data = []
-    for report in reports:
-        reports_data.append({
-            'report_id': report.report_id,
-            'username': report.user.username,
-            'description': report.description,
-            'location_name': report.location_name,
-            'severity': report.severity,
-            'status': report.status,
-            'created_at': report.created_at.strftime('%Y-%m-%d %H:%M'),
-            'image_url': report.image_url,
-            'latitude': report.latitude,
-            'longitude': report.longitude
-        })
-    
-    return jsonify(reports_data)
+    stmt = select(
+        PotholeReport.id,
+        PotholeReport.report_id,
+        CustomUser.username,
+        PotholeReport.description,
+        PotholeReport.location_name,
+        PotholeReport.severity,
+        PotholeReport.status,
+        PotholeReport.created_at,
+        PotholeReport.image_url,
+        PotholeReport.latitude,
+        PotholeReport.longitude
+    ).join(PotholeReport.user).where(PotholeReport.status == 'PENDING')
+
+    reports, next_cursor = paginate_reports(stmt)
+    return paginated_response(dump_json(reports), next_cursor)
 
 @app.route('/api/verify-report', methods=['POST'])
 @staff_required
 def verify_report():
+    if not session_user_is_staff():
+        return jsonify({'error': 'Staff access required'}), 403
+    
     try:
         data = request.get_json()
         if not data:
@@ -319,9 +588,7 @@ def verify_report():
         
         if data['action'] == 'approve':
             report.status = 'VERIFIED'
-            user = CustomUser.query.filter_by(user_id=report.user_id).first()
-            if user:
-                user.credits += 10
+            award_credits(report.user_id, 10)
         elif data['action'] == 'reject':
             report.status = 'REJECTED'
         elif data['action'] == 'need_info':
@@ -344,6 +611,7 @@ def verify_report():
         
         db.session.add(verification)
         db.session.commit()
+        clear_public_reports_cache()
         
         return jsonify({'message': 'Report verification updated successfully'})
         
@@ -354,6 +622,9 @@ def verify_report():
 @app.route('/api/update-progress', methods=['POST'])
 @staff_required
 def update_progress():
+    if not session_user_is_staff():
+        return jsonify({'error': 'Staff access required'}), 403
+    
     data = request.get_json()
     report = PotholeReport.query.filter_by(report_id=data['report_id']).first()
     
@@ -364,41 +635,52 @@ def update_progress():
     
     # Award completion bonus
     if data['status'] == 'COMPLETED':
-        user = CustomUser.query.filter_by(user_id=report.user_id).first()
-        user.credits += 5
+        award_credits(report.user_id, 5)
     
     db.session.commit()
+    clear_public_reports_cache()
     return jsonify({'message': 'Progress updated successfully'})
 
 @app.route('/api/public-reports')
 def public_reports():
     """Get verified reports for public view"""
-    reports = PotholeReport.query.filter(PotholeReport.status.in_(['VERIFIED', 'IN_PROGRESS', 'COMPLETED'])).all()
-    
-    reports_data = []
-    for report in reports:
-        reports_data.append({
-            'report_id': report.report_id,
-            'description': report.description,
-            'location_name': report.location_name,
-            'severity': report.severity,
-            'status': report.status,
-            'created_at': report.created_at.strftime('%Y-%m-%d'),
-            'latitude': report.latitude,
-            'longitude': report.longitude
-        })
-    
-    return jsonify(reports_data)
+    stmt = select(
+        PotholeReport.id,
+        PotholeReport.report_id,
+        PotholeReport.description,
+        PotholeReport.location_name,
+        PotholeReport.severity,
+        PotholeReport.status,
+        PotholeReport.created_at,
+        PotholeReport.latitude,
+        PotholeReport.longitude
+    ).where(PotholeReport.status.in_(['VERIFIED', 'IN_PROGRESS', 'COMPLETED']))
+
+    cache_key = (request.args.get('cursor'), request.args.get('limit'))
+    with public_reports_cache_lock:
+        page = public_reports_cache.get(cache_key)
+    if page is None:
+        reports, next_cursor = paginate_reports(stmt)
+        page = (dump_json(reports), next_cursor)
+        with public_reports_cache_lock:
+            public_reports_cache[cache_key] = page
+
+    return paginated_response(*page)
 
 @app.route('/image/<path:s3_key>')
 def serve_image(s3_key):
     """Generate presigned URL for S3 image"""
     try:
-        url = s3_client.generate_presigned_url(
-            'get_object',
-            Params={'Bucket': AWS_BUCKET_NAME, 'Key': s3_key},
-            ExpiresIn=3600  # 1 hour
-        )
+        with presigned_url_cache_lock:
+            url = presigned_url_cache.get(s3_key)
+        if url is None:
+            url = s3_client.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': AWS_BUCKET_NAME, 'Key': s3_key},
+                ExpiresIn=PRESIGNED_URL_EXPIRES
+            )
+            with presigned_url_cache_lock:
+                presigned_url_cache[s3_key] = url
         return redirect(url)
     except Exception as e:
         return jsonify({'error': 'Image not found'}), 404
@@ -408,16 +690,16 @@ def municipal_register():
     if request.method == 'POST':
         data = request.get_json()
         
-        if CustomUser.query.filter_by(username=data['username']).first():
+        if db.session.query(CustomUser.id).filter_by(username=data['username']).first():
             return jsonify({'error': 'Username already exists'}), 400
         
-        if CustomUser.query.filter_by(email=data['email']).first():
+        if db.session.query(CustomUser.id).filter_by(email=data['email']).first():
             return jsonify({'error': 'Email already exists'}), 400
         
         user = CustomUser(
             username=data['username'],
             email=data['email'],
-            password_hash=generate_password_hash(data['password']),
+            password_hash=hash_password(data['password']),
             is_staff=True
         )
         
@@ -429,15 +711,18 @@ def municipal_register():
     return render_template('municipal_register.html')
 
 @app.route('/municipal-login', methods=['GET', 'POST'])
+@limiter.limit('10 per minute', methods=['POST'])
+@limiter.limit('5 per minute', key_func=login_username, methods=['POST'])
 def municipal_login():
     if request.method == 'POST':
         data = request.get_json()
         user = CustomUser.query.filter_by(username=data['username']).first()
 
-        if user and check_password_hash(user.password_hash, data['password']) and user.is_staff:
+        if user and verify_password(user, data['password']) and user.is_staff:
             session['user_id'] = user.user_id
             session['username'] = user.username
             session['is_staff'] = user.is_staff
+            session.permanent = user.is_staff
             return jsonify({'message': 'Login successful', 'is_staff': user.is_staff}), 200
         
         return jsonify({'error': 'Invalid credentials or insufficient privileges'}), 401
@@ -452,36 +737,34 @@ def municipal_dashboard():
 @app.route('/api/all-reports')
 @staff_required
 def all_reports():
-    reports = PotholeReport.query.order_by(PotholeReport.created_at.desc()).all()
-
-    reports_data = []
-    for report in reports:
-        reports_data.append({
-            'report_id': report.report_id,
-            'username': report.user.username,
-            'description': report.description,
-            'location_name': report.location_name,
-            'severity': report.severity,
-            'status': report.status,
-            'created_at': report.created_at.strftime('%Y-%m-%d %H:%M'),
-            'image_url': report.image_url,
-            'latitude': report.latitude,
-            'longitude': report.longitude
-        })
-
-    return jsonify(reports_data)
+    stmt = select(
+        PotholeReport.id,
+        PotholeReport.report_id,
+        CustomUser.username,
+        PotholeReport.description,
+        PotholeReport.location_name,
+        PotholeReport.severity,
+        PotholeReport.status,
+        PotholeReport.created_at,
+        PotholeReport.image_url,
+        PotholeReport.latitude,
+        PotholeReport.longitude
+    ).join(PotholeReport.user)
+
+    reports, next_cursor = paginate_reports(stmt)
+    return paginated_response(dump_json(reports), next_cursor)
 
 @app.route('/create-staff-user', methods=['POST'])
 def create_staff_user():
     data = request.get_json()
 
-    if CustomUser.query.filter_by(username=data['username']).first():
+    if db.session.query(CustomUser.id).filter_by(username=data['username']).first():
         return jsonify({'error': 'Username already exists'}), 400
     
     user = CustomUser(
         username=data['username'],
         email=data['email'],
-        password_hash=generate_password_hash(data['password']),
+        password_hash=hash_password(data['password']),
         is_staff=True
     )
 
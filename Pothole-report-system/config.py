@@ -5,13 +5,26 @@ load_dotenv()
 
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY')
-    SQLALCHEMY_DATABASE_URI = f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
+    SQLALCHEMY_DATABASE_URI = f"mysql+mysqldb://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': 25,
+        'max_overflow': 25,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+        'pool_timeout': 10,
+        'query_cache_size': 1200
+    }
     
     AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
     AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
     AWS_BUCKET_NAME = os.getenv('AWS_BUCKET_NAME')
     AWS_REGION = os.getenv('AWS_REGION')
+    CLOUDFRONT_DOMAIN = os.getenv('CLOUDFRONT_DOMAIN')
     
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024
+
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_BR_LEVEL = 4
+    COMPRESS_MIN_SIZE = 1024
     UPLOAD_FOLDER = 'uploads'
\ No newline at end of file
@@ -8,6 +8,7 @@ CREATE TABLE custom_user (
     email VARCHAR(120) NOT NULL UNIQUE,
     phone_number VARCHAR(15),
     password_hash VARCHAR(255) NOT NULL,
+    oauth_sub VARCHAR(255) UNIQUE,
     credits INT DEFAULT 0,
     is_staff BOOLEAN DEFAULT FALSE,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -37,6 +38,8 @@ CREATE TABLE pothole_report (
     INDEX idx_status (status),
     INDEX idx_severity (severity),
     INDEX idx_created_at (created_at),
+    INDEX idx_status_created_at (status, created_at),
+    INDEX idx_user_created_at (user_id, created_at),
     INDEX idx_location (latitude, longitude)
 );
 
@@ -0,0 +1,11 @@
+import multiprocessing
+import os
+
+# Requests spend most of their time waiting on MySQL and S3, so each worker
+# runs a thread pool to keep several requests in flight at once.
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+timeout = 60
+keepalive = 5
@@ -176,6 +176,30 @@ async function makeRequest(url, options = {}, retries = 3) {
     }
 }
 
+// Largest page the API serves (MAX_PAGE_SIZE in app.py), to keep round-trips few
+const MAX_PAGE_SIZE = 200;
+
+async function fetchAllPages(url) {
+    const results = [];
+    let cursor = null;
+    
+    const baseUrl = `${url}${url.includes('?') ? '&' : '?'}limit=${MAX_PAGE_SIZE}`;
+    
+    do {
+        const pageUrl = cursor ? `${baseUrl}&cursor=${encodeURIComponent(cursor)}` : baseUrl;
+        const response = await fetch(pageUrl);
+        
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        
+        results.push(...await response.json());
+        cursor = response.headers.get('X-Next-Cursor');
+    } while (cursor);
+    
+    return results;
+}
+
 function initializeBootstrapComponents() {
     const tooltipTriggerList = document.querySelectorAll('[data-bs-toggle="tooltip"]');
     const tooltipList = [...tooltipTriggerList].map(tooltipTriggerEl => new bootstrap.Tooltip(tooltipTriggerEl));
@@ -326,6 +350,7 @@ window.PotholeApp = {
     validateCoordinates,
     compressImage,
     makeRequest,
+    fetchAllPages,
     debounce,
     copyToClipboard,
     geolocation